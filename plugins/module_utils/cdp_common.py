@@ -20,9 +20,10 @@ A common Ansible Module for shared functions in the Cloudera CDP Collection
 """
 
 from functools import wraps
+from typing import TYPE_CHECKING
 
-from cdpy.cdpy import Cdpy
-from cdpy.common import CdpError, CdpWarning
+if TYPE_CHECKING:
+    from cdpy.common import CdpError, CdpWarning
 
 
 __credits__ = ["cleroy@cloudera.com"]
@@ -59,7 +60,10 @@ class CdpModule(object):
         self.log_lines = []
         self.changed = False
 
-        # Client Wrapper
+        # Client Wrapper, imported here so that argument validation failures
+        # return before the CDP SDK is loaded
+        from cdpy.cdpy import Cdpy
+
         self.cdpy = Cdpy(
             debug=self.debug,
             tls_verify=self.tls,
@@ -15,6 +15,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from random import uniform
+from time import monotonic
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_common import CdpModule
 
@@ -40,7 +43,7 @@ options:
   catalog_id:
     description:
       - The identifier of the Database Catalog.
-      - Required if C(state=absent).
+      - Required if C(state=absent) and I(name) is not set.
     type: str
     aliases:
       - id
@@ -74,8 +77,9 @@ options:
     default: True
   delay:
     description:
-      - The internal polling interval (in seconds) while the module waits for the Data Catalog to achieve the declared
-        state.
+      - The maximum internal polling interval (in seconds) while the module waits for the Data Catalog to achieve the
+        declared state.
+      - The interval starts at 2 seconds and doubles on each poll until it reaches this value.
     type: int
     default: 15
     aliases:
@@ -106,12 +110,34 @@ EXAMPLES = r"""
     catalog_id: example-database-id
     cluster_id: example-cluster-id
     state: absent
+
+# Create several Database Catalogs in parallel with Async wait
+- cloudera.cloud.dw_database_catalog:
+    name: "{{ item }}"
+    cluster_id: example-cluster-id
+    wait: yes
+  async: 3600
+  poll: 0
+  loop:
+    - example-catalog-one
+    - example-catalog-two
+  register: __dbc_requests
+
+- ansible.builtin.async_status:
+    jid: "{{ item.ansible_job_id }}"
+  loop: "{{ __dbc_requests.results }}"
+  register: __dbc_results
+  until: __dbc_results.finished
+  retries: 120
+  delay: 30
 """
 
 RETURN = r"""
 ---
 database_catalog:
-  description: Details about the Database Catalog.
+  description:
+    - Details about the Database Catalog.
+    - Only the identifier, name, and status are returned unless run with increased verbosity, e.g. C(-v).
   returned: always
   type: dict
   contains:
@@ -169,13 +195,10 @@ class DwDatabaseCatalog(CdpModule):
             dbcs = self.cdpy.dw.list_dbcs(cluster_id=self.cluster_id)
             for dbc in dbcs:
                 if dbc["name"] == self.name:
-                    self.target = self.cdpy.dw.describe_dbc(
-                        cluster_id=self.cluster_id, dbc_id=dbc["id"]
-                    )
+                    self.target = self._describe(dbc["id"])
+                    break
         else:
-            self.target = self.cdpy.dw.describe_dbc(
-                cluster_id=self.cluster_id, dbc_id=self.catalog_id
-            )
+            self.target = self._describe(self.catalog_id)
 
         if self.target is not None:
             # Begin Database Catalog Exists
@@ -195,22 +218,15 @@ class DwDatabaseCatalog(CdpModule):
                         )
                         self.changed = True
                         if self.wait:
-                            self.cdpy.sdk.wait_for_state(
-                                describe_func=self.cdpy.dw.describe_dbc,
-                                params=dict(
-                                    cluster_id=self.cluster_id, dbc_id=self.target["id"]
-                                ),
-                                field=None,
-                                delay=self.delay,
-                                timeout=self.timeout,
-                            )
+                            self._wait_backoff(self.target["id"])
                         else:
-                            self.cdpy.sdk.sleep(self.delay)  # Wait for consistency sync
-                            self.database_catalog = self.cdpy.dw.describe_dbc(
-                                cluster_id=self.cluster_id, dbc_id=self.target["id"]
-                            )
+                            self.target["status"] = "Deleting"
+                            self.database_catalog = self.target
                     # End Drop
             elif self.state == "present":
+                if self.target["status"] in self.cdpy.sdk.STARTED_STATES:
+                    self.database_catalog = self.target
+                    return
                 # Begin Config Check
                 self.module.warn(
                     "Database Catalog already present and reconciliation is not yet implemented"
@@ -221,19 +237,11 @@ class DwDatabaseCatalog(CdpModule):
                         msg="Unable to restart a stopped DB Catalog. You must manually restart."
                     )
                 if self.wait:
-                    self.target = self.cdpy.sdk.wait_for_state(
-                        describe_func=self.cdpy.dw.describe_dbc,
-                        params=dict(
-                            cluster_id=self.cluster_id, dbc_id=self.target["id"]
-                        ),
-                        state=self.cdpy.sdk.STARTED_STATES,
-                        delay=self.delay,
-                        timeout=self.timeout,
+                    self.target = self._wait_backoff(
+                        self.target["id"], self.cdpy.sdk.STARTED_STATES
                     )
                 self.database_catalog = self.target
                 # End Config Check
-            else:
-                self.module.fail_json(msg="Invalid state %s" % self.state)
             # End Database Catalog Exists
         else:
             # Begin Database Catalog Not Found
@@ -243,31 +251,65 @@ class DwDatabaseCatalog(CdpModule):
                     % (self.name, self.cluster_id)
                 )
             elif self.state == "present":
-                if not self.module.check_mode:
+                self.changed = True
+                if self.module.check_mode:
+                    self.database_catalog = dict(id=None, name=self.name, status=None)
+                else:
                     dbc_id = self.cdpy.dw.create_dbc(
                         cluster_id=self.cluster_id,
                         name=self.name,
                         load_demo_data=self.load_demo_data,
                     )
-                    self.changed = True
                     if self.wait:
-                        self.database_catalog = self.cdpy.sdk.wait_for_state(
-                            describe_func=self.cdpy.dw.describe_dbc,
-                            params=dict(cluster_id=self.cluster_id, dbc_id=dbc_id),
-                            state=self.cdpy.sdk.STARTED_STATES,
-                            delay=self.delay,
-                            timeout=self.timeout,
+                        self.database_catalog = self._wait_backoff(
+                            dbc_id, self.cdpy.sdk.STARTED_STATES
                         )
                     else:
-                        self.database_catalog = self.cdpy.dw.describe_dbc(
-                            cluster_id=self.cluster_id, dbc_id=dbc_id
-                        )
-            else:
-                self.module.fail_json(
-                    msg="State %s is not valid for this module" % self.state
-                )
+                        self.database_catalog = self._describe(dbc_id)
             # End Database Catalog Not Found
 
+    def _describe(self, dbc_id):
+        """Fetches the Database Catalog within the Cluster, or None if not found"""
+        return self.cdpy.dw.describe_dbc(cluster_id=self.cluster_id, dbc_id=dbc_id)
+
+    def _wait_backoff(self, dbc_id, state=None, base=2):
+        """Poll until the Database Catalog reaches one of the given states, or is removed if state is None.
+
+        The polling interval doubles from base, with jitter, until it reaches the configured delay.
+        """
+        if state is not None:
+            state = frozenset(state)
+        failed_states = frozenset(self.cdpy.sdk.FAILED_STATES)
+        sleep = self.cdpy.sdk.sleep
+        cap = self.delay
+        deadline = monotonic() + self.timeout
+
+        attempt = 0
+        while monotonic() < deadline:
+            current = self._describe(dbc_id)
+            if current is None:
+                if state is None:
+                    return current
+            elif state is not None:
+                status = current["status"]
+                if status in state:
+                    return current
+                if status in failed_states:
+                    self.module.fail_json(
+                        msg="Database Catalog %s entered a failed state: %s"
+                        % (dbc_id, status)
+                    )
+            interval = base * 2**attempt
+            if interval < cap:
+                sleep(uniform(interval / 2, interval))
+                attempt += 1
+            else:
+                sleep(cap)
+        self.module.fail_json(
+            msg="Timeout waiting for Database Catalog %s to reach state %s"
+            % (dbc_id, "absent" if state is None else ", ".join(sorted(state)))
+        )
+
 
 def main():
     module = AnsibleModule(
@@ -290,7 +332,14 @@ def main():
     )
 
     result = DwDatabaseCatalog(module)
-    output = dict(changed=result.changed, database_catalog=result.database_catalog)
+
+    database_catalog = result.database_catalog
+    if database_catalog and module._verbosity < 1:
+        database_catalog = {
+            k: v for k, v in database_catalog.items() if k in ("id", "name", "status")
+        }
+
+    output = dict(changed=result.changed, database_catalog=database_catalog)
 
     if result.debug:
         output.update(sdk_out=result.log_out, sdk_out_lines=result.log_lines)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+import unittest
+
+from unittest.mock import patch
+
+from ansible_collections.cloudera.cloud.plugins.modules import dw_database_catalog
+from ansible_collections.cloudera.cloud.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    setup_module_args,
+)
+
+
+def catalog(status, **kwargs):
+    return dict(id="dbc-1", name="example", status=status, **kwargs)
+
+
+class TestDwDatabaseCatalog(ModuleTestCase):
+    def setUp(self):
+        super(TestDwDatabaseCatalog, self).setUp()
+        self.mock_cdpy = patch("cdpy.cdpy.Cdpy")
+        self.client = self.mock_cdpy.start().return_value
+        self.addCleanup(self.mock_cdpy.stop)
+
+        self.client.sdk.STARTED_STATES = ["Running"]
+        self.client.sdk.STOPPED_STATES = ["Stopped"]
+        self.client.sdk.FAILED_STATES = ["Error"]
+        self.client.sdk.REMOVABLE_STATES = ["Running", "Error"]
+
+    def test_create_wait_reaches_state(self):
+        setup_module_args({"cluster_id": "cluster-1", "name": "example"})
+
+        self.client.dw.list_dbcs.return_value = []
+        self.client.dw.create_dbc.return_value = "dbc-1"
+        self.client.dw.describe_dbc.side_effect = [
+            catalog("Creating"),
+            catalog("Creating"),
+            catalog("Running"),
+        ]
+
+        with pytest.raises(AnsibleExitJson) as e:
+            dw_database_catalog.main()
+
+        result = e.value.args[0]
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["database_catalog"], catalog("Running"))
+        self.assertEqual(self.client.dw.describe_dbc.call_count, 3)
+
+    def test_create_wait_failed_state(self):
+        setup_module_args({"cluster_id": "cluster-1", "name": "example"})
+
+        self.client.dw.list_dbcs.return_value = []
+        self.client.dw.create_dbc.return_value = "dbc-1"
+        self.client.dw.describe_dbc.side_effect = [
+            catalog("Creating"),
+            catalog("Error"),
+        ]
+
+        with pytest.raises(AnsibleFailJson) as e:
+            dw_database_catalog.main()
+
+        self.assertIn("failed state: Error", e.value.args[0]["msg"])
+
+    def test_delete_wait_removed(self):
+        setup_module_args({"cluster_id": "cluster-1", "id": "dbc-1", "state": "absent"})
+
+        self.client.dw.describe_dbc.side_effect = [
+            catalog("Running"),
+            catalog("Deleting"),
+            None,
+        ]
+
+        with pytest.raises(AnsibleExitJson) as e:
+            dw_database_catalog.main()
+
+        self.assertTrue(e.value.args[0]["changed"])
+        self.client.dw.delete_dbc.assert_called_once_with(
+            cluster_id="cluster-1", dbc_id="dbc-1"
+        )
+        self.assertEqual(self.client.dw.describe_dbc.call_count, 3)
+
+    def test_wait_timeout(self):
+        setup_module_args({"cluster_id": "cluster-1", "name": "example", "timeout": 60})
+
+        self.client.dw.list_dbcs.return_value = []
+        self.client.dw.create_dbc.return_value = "dbc-1"
+        self.client.dw.describe_dbc.return_value = catalog("Creating")
+
+        with patch.object(
+            dw_database_catalog, "monotonic", side_effect=[0, 30, 61]
+        ), pytest.raises(AnsibleFailJson) as e:
+            dw_database_catalog.main()
+
+        self.assertEqual(
+            e.value.args[0]["msg"],
+            "Timeout waiting for Database Catalog dbc-1 to reach state Running",
+        )
+        self.assertEqual(self.client.dw.describe_dbc.call_count, 1)
+
+    def test_wait_interval_capped_at_delay(self):
+        setup_module_args({"cluster_id": "cluster-1", "name": "example", "delay": 15})
+
+        self.client.dw.list_dbcs.return_value = []
+        self.client.dw.create_dbc.return_value = "dbc-1"
+        self.client.dw.describe_dbc.side_effect = [catalog("Creating")] * 7 + [
+            catalog("Running")
+        ]
+
+        with pytest.raises(AnsibleExitJson):
+            dw_database_catalog.main()
+
+        intervals = [c.args[0] for c in self.client.sdk.sleep.call_args_list]
+        self.assertEqual(len(intervals), 7)
+        for interval, upper in zip(intervals, [2, 4, 8]):
+            self.assertGreaterEqual(interval, upper / 2)
+            self.assertLessEqual(interval, upper)
+        self.assertEqual(intervals[3:], [15, 15, 15, 15])
+
+    def test_create_check_mode(self):
+        setup_module_args(
+            {"cluster_id": "cluster-1", "name": "example", "_ansible_check_mode": True}
+        )
+
+        self.client.dw.list_dbcs.return_value = []
+
+        with pytest.raises(AnsibleExitJson) as e:
+            dw_database_catalog.main()
+
+        result = e.value.args[0]
+        self.assertTrue(result["changed"])
+        self.assertEqual(
+            result["database_catalog"], dict(id=None, name="example", status=None)
+        )
+        self.client.dw.create_dbc.assert_not_called()
+
+    def test_output_trimmed_by_default(self):
+        setup_module_args({"cluster_id": "cluster-1", "name": "example"})
+
+        self.client.dw.list_dbcs.return_value = [catalog("Running")]
+        self.client.dw.describe_dbc.return_value = catalog("Running", extra="value")
+
+        with pytest.raises(AnsibleExitJson) as e:
+            dw_database_catalog.main()
+
+        self.assertEqual(e.value.args[0]["database_catalog"], catalog("Running"))
+
+    def test_output_full_when_verbose(self):
+        setup_module_args(
+            {"cluster_id": "cluster-1", "name": "example", "_ansible_verbosity": 1}
+        )
+
+        self.client.dw.list_dbcs.return_value = [catalog("Running")]
+        self.client.dw.describe_dbc.return_value = catalog("Running", extra="value")
+
+        with pytest.raises(AnsibleExitJson) as e:
+            dw_database_catalog.main()
+
+        self.assertEqual(
+            e.value.args[0]["database_catalog"], catalog("Running", extra="value")
+        )
+
+    def test_create_no_wait_not_yet_visible(self):
+        setup_module_args({"cluster_id": "cluster-1", "name": "example", "wait": False})
+
+        self.client.dw.list_dbcs.return_value = []
+        self.client.dw.create_dbc.return_value = "dbc-1"
+        self.client.dw.describe_dbc.return_value = None
+
+        with pytest.raises(AnsibleExitJson) as e:
+            dw_database_catalog.main()
+
+        self.assertTrue(e.value.args[0]["changed"])
+        self.assertIsNone(e.value.args[0]["database_catalog"])
+
+
+if __name__ == "__main__":
+    unittest.main()